@@ -0,0 +1,229 @@
+# activity_matrix.py
+
+import os
+import json
+import datetime
+import operator
+import numpy as np
+import pytz
+
+# File where user stats are persisted (same file the bot writes every 60s).
+USER_STATS_FILE = "user_stats.json"
+# Default on-disk location of the materialised matrix and its index.
+MATRIX_FILE = "activity_matrix.npy"
+MATRIX_INDEX_FILE = "activity_matrix_index.json"
+
+# Date format used as the key of each entry in "daily_stats".
+DATE_FORMAT = "%d-%m-%Y"
+# Timezone the bot uses when picking the "daily_stats" key for a message.
+STATS_TIMEZONE = "Asia/Kolkata"
+# Metric columns, in the order they are stored along the last axis.
+METRICS = ("messages_sent", "replied", "vulgar_sent")
+
+_COMPARATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def stats_today() -> datetime.date:
+    """Today's date as the bot sees it when writing daily_stats."""
+    return datetime.datetime.now().astimezone(pytz.timezone(STATS_TIMEZONE)).date()
+
+
+class ActivityMatrix:
+    """
+    Columnar view of user_stats as a users x days x metrics array.
+
+    Row i belongs to user_ids[i], column j is the day start_date + j (days
+    with no activity are zero-filled), and the last axis follows METRICS.
+    Every query works on all users at once and returns one value per user.
+    """
+
+    def __init__(self, data, user_ids, names, roles, start_date):
+        self.data = data
+        self.user_ids = list(user_ids)
+        self.names = list(names)
+        self.roles = list(roles)
+        self.start_date = start_date
+        self._row_of = {user_id: i for i, user_id in enumerate(self.user_ids)}
+
+    @property
+    def num_days(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def end_date(self) -> datetime.date:
+        """Last day covered by the matrix (inclusive)."""
+        return self.start_date + datetime.timedelta(days=self.num_days - 1)
+
+    def row(self, user_id: str) -> int:
+        """Row index of a user, raising KeyError if they have no stats."""
+        return self._row_of[str(user_id)]
+
+    def metric(self, name: str) -> np.ndarray:
+        """Return the users x days slice for one metric."""
+        if name not in METRICS:
+            raise ValueError(f"Unknown metric '{name}'. Expected one of {METRICS}.")
+        return self.data[:, :, METRICS.index(name)]
+
+    def _day_index(self, day: datetime.date) -> int:
+        return (day - self.start_date).days
+
+    def window_sum(self, name: str, days: int, end: datetime.date = None) -> np.ndarray:
+        """
+        Per-user total of a metric over the `days` days ending at `end`
+        (inclusive, defaults to today in STATS_TIMEZONE). Parts of the
+        window outside the matrix count as zero.
+        """
+        if days <= 0:
+            raise ValueError("days must be a positive integer")
+        end_idx = self._day_index(end or stats_today())
+        stop = min(end_idx + 1, self.num_days)
+        start = max(end_idx - days + 1, 0)
+        if stop <= start:
+            return np.zeros(len(self.user_ids), dtype=np.int64)
+        return self.metric(name)[:, start:stop].sum(axis=1, dtype=np.int64)
+
+    def rolling_sum(self, name: str, days: int) -> np.ndarray:
+        """
+        users x days array where cell (i, j) is the total of the metric for
+        user i over the `days` days ending at day j.
+        """
+        if days <= 0:
+            raise ValueError("days must be a positive integer")
+        values = self.metric(name)
+        cumulative = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int64)
+        np.cumsum(values, axis=1, dtype=np.int64, out=cumulative[:, 1:])
+        window_start = np.maximum(np.arange(values.shape[1]) + 1 - days, 0)
+        return cumulative[:, 1:] - cumulative[:, window_start]
+
+    def ratio(self, numerator: str, denominator, days: int, end: datetime.date = None) -> np.ndarray:
+        """
+        Per-user ratio of two windowed sums. `denominator` may be a single
+        metric name or a list of names that are added together (e.g. vulgar
+        messages over all messages sent and replied). Users with nothing in
+        the denominator get 0.0.
+        """
+        if isinstance(denominator, str):
+            denominator = [denominator]
+        if not denominator:
+            raise ValueError("denominator must name at least one metric")
+        num = self.window_sum(numerator, days, end).astype(np.float64)
+        den = sum(self.window_sum(name, days, end) for name in denominator).astype(np.float64)
+        out = np.zeros_like(num)
+        np.divide(num, den, out=out, where=den > 0)
+        return out
+
+    def threshold(self, values: np.ndarray, op: str, limit) -> list:
+        """Return the user IDs whose value satisfies `value <op> limit`."""
+        if op not in _COMPARATORS:
+            raise ValueError(f"Unknown comparison '{op}'. Expected one of {list(_COMPARATORS)}.")
+        mask = _COMPARATORS[op](np.asarray(values), limit)
+        return [self.user_ids[i] for i in np.flatnonzero(mask)]
+
+    def save(self, matrix_path: str = MATRIX_FILE, index_path: str = MATRIX_INDEX_FILE):
+        """Write the array as .npy and the user/date index as JSON."""
+        if isinstance(self.data, np.memmap) and os.path.abspath(self.data.filename) == os.path.abspath(matrix_path):
+            self.data.flush()
+        else:
+            np.save(matrix_path, self.data)
+        with open(index_path, "w") as f:
+            json.dump(self._index(), f, indent=2)
+        print(f"💾 Saved activity matrix {self.data.shape} to {matrix_path}")
+
+    def _index(self) -> dict:
+        return {
+            "start_date": self.start_date.strftime(DATE_FORMAT),
+            "metrics": list(METRICS),
+            "user_ids": self.user_ids,
+            "names": self.names,
+            "roles": self.roles,
+        }
+
+
+def _parse_days(user_stats: dict) -> dict:
+    """Map every date key in user_stats to a datetime.date, skipping bad keys."""
+    parsed = {}
+    for user_data in user_stats.values():
+        for day_str in user_data.get("daily_stats", {}):
+            if day_str in parsed:
+                continue
+            try:
+                parsed[day_str] = datetime.datetime.strptime(day_str, DATE_FORMAT).date()
+            except ValueError:
+                print(f"Skipping invalid date key: {day_str}")
+    return parsed
+
+
+def build_activity_matrix(user_stats: dict, mmap_path: str = None) -> ActivityMatrix:
+    """
+    Materialise user_stats into an ActivityMatrix. The day axis runs from
+    the first recorded day up to today, so recent windows of quiet users
+    are zero. If `mmap_path` is given the array is created as a
+    memory-mapped .npy file at that path instead of in RAM.
+    """
+    day_of = _parse_days(user_stats)
+    user_ids = list(user_stats.keys())
+    today = stats_today()
+    start_date = min(day_of.values(), default=today)
+    end_date = max(max(day_of.values(), default=today), today)
+    num_days = (end_date - start_date).days + 1
+
+    shape = (len(user_ids), num_days, len(METRICS))
+    if mmap_path:
+        data = np.lib.format.open_memmap(mmap_path, mode="w+", dtype=np.int32, shape=shape)
+        data[:] = 0
+    else:
+        data = np.zeros(shape, dtype=np.int32)
+
+    names, roles = [], []
+    for i, user_id in enumerate(user_ids):
+        user_data = user_stats[user_id]
+        names.append(user_data.get("name"))
+        roles.append(user_data.get("role"))
+        for day_str, day_stats in user_data.get("daily_stats", {}).items():
+            day = day_of.get(day_str)
+            if day is None:
+                continue
+            j = (day - start_date).days
+            data[i, j] = [day_stats.get(name, 0) for name in METRICS]
+
+    return ActivityMatrix(data, user_ids, names, roles, start_date)
+
+
+def load_activity_matrix(matrix_path: str = MATRIX_FILE, index_path: str = MATRIX_INDEX_FILE,
+                         mmap: bool = True) -> ActivityMatrix:
+    """Load a matrix written by ActivityMatrix.save, memory-mapped read-only by default."""
+    with open(index_path, "r") as f:
+        index = json.load(f)
+    if tuple(index.get("metrics", METRICS)) != METRICS:
+        raise ValueError(f"{index_path} was written with metrics {index['metrics']}, expected {METRICS}.")
+    data = np.load(matrix_path, mmap_mode="r" if mmap else None)
+    start_date = datetime.datetime.strptime(index["start_date"], DATE_FORMAT).date()
+    return ActivityMatrix(data, index["user_ids"], index["names"], index["roles"], start_date)
+
+
+def load_user_stats(path: str = USER_STATS_FILE) -> dict:
+    """Load the user_stats from a JSON file if it exists."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"ℹ️ No existing {path} found.")
+        return {}
+
+
+if __name__ == "__main__":
+    matrix = build_activity_matrix(load_user_stats())
+    matrix.save()
+
+    weekly_messages = matrix.window_sum("messages_sent", 7)
+    vulgar_ratio = matrix.ratio("vulgar_sent", ["messages_sent", "replied"], 30)
+    for user_id, name, sent, ratio in zip(matrix.user_ids, matrix.names, weekly_messages, vulgar_ratio):
+        print(f"{user_id} ({name}): {sent} messages in last 7 days, vulgar ratio {ratio:.2%} this month")
+    print(f"Users with >10% vulgar messages this month: {matrix.threshold(vulgar_ratio, '>', 0.10)}")
@@ -185,6 +185,7 @@ ROLE_REQUESTS_FILE = "role_requests.json"
 ROLE_HISTORY_FILE = "role_change_history.json"
 requests_lock = threading.Lock()
 history_lock = threading.Lock()
+ROLE_ACTIONS = ("assign_role", "upgrade_role", "degrade_role")
 
 # Replace with your real guild ID
 GUILD_ID = 1337419131858845794  # Make sure the bot is in this server
@@ -193,7 +194,8 @@ GUILD_ID = 1337419131858845794  # Make sure the bot is in this server
 async def process_role_requests():
     """
     Background task to read role_requests.json, apply changes, and log them
-    in role_change_history.json.
+    in role_change_history.json. Requests needing human intervention are
+    moved to the pending review queue instead of being kept in the file.
     """
     with requests_lock:
         # Load queued requests
@@ -211,14 +213,9 @@ async def process_role_requests():
             print(f"⚠️ Could not find guild with ID {GUILD_ID}. Check your settings.")
             return
 
-        remaining_requests = []  # requests we'll keep if unprocessed
-
         for req in requests_data:
             user_id_str = req.get("user_id")
             action = req.get("action")
-            role_name = req.get("role")
-            reason = req.get("reason", "No reason")
-            human_intervention = req.get("human_intervention", False)
 
             if not user_id_str or not action:
                 print(f"Skipping invalid request: {req}")
@@ -231,44 +228,54 @@ async def process_role_requests():
                 print(f"Invalid user ID: {user_id_str}")
                 continue
 
+            if req.get("human_intervention", False):
+                add_pending_review(req)
+                continue
+
             member = guild.get_member(user_id)
             if not member:
                 print(f"User {user_id} not found in guild {guild.id}.")
                 continue
 
-            if human_intervention:
-                print(f"Request requires human intervention: {req}")
-                remaining_requests.append(req)
-                continue
+            await apply_role_request(guild, member, req)
 
-            # Gather old roles for history
-            old_roles = [r.name for r in member.roles if r.name != "@everyone"]
-
-            # Perform the action
-            if action == "kick":
-                success = await handle_kick(member, reason)
-                if success:
-                    log_role_history(user_id, member.name, old_roles, None, action, reason)
-            elif action in ["assign_role", "upgrade_role", "degrade_role"]:
-                if role_name:
-                    role_obj = discord.utils.get(guild.roles, name=role_name)
-                    if not role_obj:
-                        print(f"❌ Role '{role_name}' not found in guild {guild.id}.")
-                        continue
-
-                    success = await handle_add_role(member, role_obj, reason, action)
-                    if success:
-                        log_role_history(user_id, member.name, old_roles, role_obj.name, action, reason)
-                else:
-                    print(f"No role specified for action '{action}', skipping.")
-            elif action == "no_change":
-                print(f"No change for user {user_id}, skipping.")
-            else:
-                print(f"Unrecognized action '{action}' for user {user_id}, skipping.")
-
-        # Rewrite only the unprocessed or intervention-needed requests
+        # Everything has been applied, dropped or moved to the review queue
         with open(ROLE_REQUESTS_FILE, "w") as f:
-            json.dump(remaining_requests, f, indent=2)
+            json.dump([], f, indent=2)
+
+async def apply_role_request(guild: discord.Guild, member: discord.Member, req: dict) -> bool:
+    """Perform the action described by a role request, return True if a change was made."""
+    action = req.get("action")
+    role_name = req.get("role")
+    reason = req.get("reason", "No reason")
+
+    # Gather old roles for history
+    old_roles = [r.name for r in member.roles if r.name != "@everyone"]
+
+    # Perform the action
+    if action == "kick":
+        success = await handle_kick(member, reason)
+        if success:
+            log_role_history(member.id, member.name, old_roles, None, action, reason)
+        return success
+    elif action in ROLE_ACTIONS:
+        if not role_name:
+            print(f"No role specified for action '{action}', skipping.")
+            return False
+        role_obj = discord.utils.get(guild.roles, name=role_name)
+        if not role_obj:
+            print(f"❌ Role '{role_name}' not found in guild {guild.id}.")
+            return False
+
+        success = await handle_add_role(member, role_obj, reason, action)
+        if success:
+            log_role_history(member.id, member.name, old_roles, role_obj.name, action, reason)
+        return success
+    elif action == "no_change":
+        print(f"No change for user {member.id}, skipping.")
+    else:
+        print(f"Unrecognized action '{action}' for user {member.id}, skipping.")
+    return False
 
 async def handle_kick(member: discord.Member, reason: str) -> bool:
     """Try to kick the user."""
@@ -327,6 +334,217 @@ def log_role_history(user_id: int, user_name: str, old_roles: list, new_role: st
     print(f"📝 Logged role change: {entry}")
 
 
+# ----------------------------------------------------
+#   PART 3: Human Review Queue
+# ----------------------------------------------------
+PENDING_REVIEWS_FILE = "pending_reviews.json"
+REVIEW_EXPIRY_HOURS = 72
+REVIEWABLE_ACTIONS = ROLE_ACTIONS + ("kick",)
+DISCORD_MESSAGE_LIMIT = 2000
+reviews_lock = threading.Lock()
+pending_reviews = {}          # request_id -> review entry
+pending_reviews_by_user = {}  # user_id -> set of request_ids
+
+def load_pending_reviews():
+    """Load the pending review queue from a JSON file if it exists."""
+    global pending_reviews, pending_reviews_by_user
+    with reviews_lock:
+        try:
+            with open(PENDING_REVIEWS_FILE, "r") as f:
+                pending_reviews = json.load(f)
+        except FileNotFoundError:
+            pending_reviews = {}
+        pending_reviews_by_user = {}
+        for request_id, entry in pending_reviews.items():
+            pending_reviews_by_user.setdefault(entry["user_id"], set()).add(request_id)
+    print(f"✅ Loaded {len(pending_reviews)} pending reviews from {PENDING_REVIEWS_FILE}")
+
+def save_pending_reviews():
+    """Save the pending review queue to a JSON file. Caller must hold reviews_lock."""
+    with open(PENDING_REVIEWS_FILE, "w") as f:
+        json.dump(pending_reviews, f, indent=2)
+
+def add_pending_review(req: dict):
+    """
+    Move a role request into the review queue. If the same action is already
+    pending for the user, refresh that entry's reason and queued_at instead.
+    """
+    user_id_str = str(req.get("user_id"))
+    action = req.get("action")
+    if action not in REVIEWABLE_ACTIONS or (action in ROLE_ACTIONS and not req.get("role")):
+        print(f"Request is not actionable, not queueing for review: {req}")
+        return
+
+    with reviews_lock:
+        for request_id in pending_reviews_by_user.get(user_id_str, ()):
+            existing = pending_reviews[request_id]
+            if existing["action"] == req.get("action") and existing["role"] == req.get("role"):
+                existing["reason"] = req.get("reason", "No reason")
+                existing["queued_at"] = datetime.datetime.utcnow().isoformat()
+                save_pending_reviews()
+                print(f"🔁 Review {request_id} recommended again, refreshed: {req}")
+                return
+
+        request_id = uuid.uuid4().hex[:8]
+        pending_reviews[request_id] = {
+            "request_id": request_id,
+            "user_id": user_id_str,
+            "action": req.get("action"),
+            "role": req.get("role"),
+            "reason": req.get("reason", "No reason"),
+            "queued_at": datetime.datetime.utcnow().isoformat()
+        }
+        pending_reviews_by_user.setdefault(user_id_str, set()).add(request_id)
+        save_pending_reviews()
+    print(f"🕵️ Request {request_id} queued for human review: {req}")
+
+def pop_pending_review(request_id: str):
+    """Remove a review from the queue and return it, or None if it does not exist."""
+    with reviews_lock:
+        entry = pending_reviews.pop(request_id, None)
+        if entry is None:
+            return None
+        user_ids = pending_reviews_by_user.get(entry["user_id"], set())
+        user_ids.discard(request_id)
+        if not user_ids:
+            pending_reviews_by_user.pop(entry["user_id"], None)
+        save_pending_reviews()
+    return entry
+
+def restore_pending_review(entry: dict):
+    """Put a popped review back in the queue under its original request ID."""
+    with reviews_lock:
+        pending_reviews[entry["request_id"]] = entry
+        pending_reviews_by_user.setdefault(entry["user_id"], set()).add(entry["request_id"])
+        save_pending_reviews()
+
+def log_review_decision(entry: dict, decision: str, reason: str):
+    """Record a review that was closed without being applied in role_change_history.json."""
+    guild = bot.get_guild(GUILD_ID)
+    member = guild.get_member(int(entry["user_id"])) if guild else None
+    user_name = member.name if member else None
+    old_roles = [r.name for r in member.roles if r.name != "@everyone"] if member else []
+    log_role_history(entry["user_id"], user_name, old_roles, None, f"{decision}_{entry['action']}", reason)
+
+@tasks.loop(hours=1)
+async def expire_reviews_loop():
+    """Background task that drops reviews older than REVIEW_EXPIRY_HOURS."""
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=REVIEW_EXPIRY_HOURS)
+    expired = [
+        request_id for request_id, entry in list(pending_reviews.items())
+        if datetime.datetime.fromisoformat(entry["queued_at"]) < cutoff
+    ]
+    for request_id in expired:
+        entry = pop_pending_review(request_id)
+        if entry:
+            print(f"⌛ Review {request_id} expired without a decision: {entry}")
+            log_review_decision(
+                entry, "expire",
+                f"Review {request_id} expired after {REVIEW_EXPIRY_HOURS}h without a decision: {entry['reason']}"
+            )
+
+def in_review_guild():
+    """Only allow review commands in GUILD_ID, the guild the queue belongs to."""
+    async def predicate(ctx):
+        return ctx.guild is not None and ctx.guild.id == GUILD_ID
+    return commands.check(predicate)
+
+async def send_lines(ctx, header: str, lines: list):
+    """Send lines in as many messages as needed to stay under Discord's length limit."""
+    chunk = header
+    for line in lines:
+        if len(chunk) + len(line) + 1 > DISCORD_MESSAGE_LIMIT:
+            await ctx.send(chunk)
+            chunk = ""
+        chunk = f"{chunk}\n{line}" if chunk else line
+    if chunk:
+        await ctx.send(chunk)
+
+@bot.command(name="pendingreviews")
+@in_review_guild()
+@commands.has_permissions(manage_roles=True)
+async def list_pending_reviews(ctx, member: discord.Member = None):
+    """List role requests waiting for a moderator, optionally for a single member."""
+    if member:
+        request_ids = sorted(pending_reviews_by_user.get(str(member.id), ()))
+    else:
+        request_ids = list(pending_reviews)
+
+    if not request_ids:
+        await ctx.send("✅ No role requests are waiting for review.")
+        return
+
+    lines = []
+    for request_id in request_ids:
+        entry = pending_reviews[request_id]
+        target = f" → {entry['role']}" if entry["role"] else ""
+        reason = entry["reason"] if len(entry["reason"]) <= 200 else entry["reason"][:197] + "..."
+        lines.append(
+            f"`{request_id}` <@{entry['user_id']}> **{entry['action']}**{target} "
+            f"(queued {entry['queued_at'][:16]} UTC): {reason}"
+        )
+    await send_lines(ctx, f"**Pending role reviews ({len(lines)}):**", lines)
+
+@bot.command(name="approve")
+@in_review_guild()
+@commands.has_permissions(manage_roles=True)
+async def approve_review(ctx, request_id: str):
+    """
+    Approve a pending review and apply its role change. Moderators can only
+    approve what Discord would let them do directly: kicks need Kick Members
+    and roles must be below their own top role.
+    """
+    entry = pending_reviews.get(request_id)
+    if not entry:
+        await ctx.send(f"⚠️ No pending review with ID `{request_id}`.")
+        return
+
+    guild = bot.get_guild(GUILD_ID)
+    if entry["action"] == "kick":
+        if not ctx.author.guild_permissions.kick_members:
+            await ctx.send(f"⛔ You need the Kick Members permission to approve `{request_id}`.")
+            return
+    else:
+        role_obj = discord.utils.get(guild.roles, name=entry["role"])
+        if not role_obj:
+            await ctx.send(f"⚠️ Role '{entry['role']}' no longer exists. Review `{request_id}` is still pending.")
+            return
+        if ctx.author != guild.owner and role_obj >= ctx.author.top_role:
+            await ctx.send(f"⛔ '{role_obj.name}' is not below your top role, so you cannot approve `{request_id}`.")
+            return
+
+    # Take the entry out of the queue before applying so a concurrent approval can't apply it twice
+    entry = pop_pending_review(request_id)
+    if not entry:
+        await ctx.send(f"⚠️ Review `{request_id}` was already handled.")
+        return
+
+    member = guild.get_member(int(entry["user_id"]))
+    if not member:
+        await ctx.send(f"⚠️ User {entry['user_id']} is no longer in this server. Review `{request_id}` dropped.")
+        return
+
+    req = dict(entry, reason=f"{entry['reason']} (approved by {ctx.author.name})")
+    if await apply_role_request(guild, member, req):
+        await ctx.send(f"✅ Approved `{request_id}`: {entry['action']} applied to {member.mention}.")
+    else:
+        restore_pending_review(entry)
+        await ctx.send(f"❌ Could not apply `{request_id}`. It is still pending; check the bot logs.")
+
+@bot.command(name="deny")
+@in_review_guild()
+@commands.has_permissions(manage_roles=True)
+async def deny_review(ctx, request_id: str, *, reason: str = "No reason"):
+    """Deny a pending review without applying it."""
+    entry = pop_pending_review(request_id)
+    if not entry:
+        await ctx.send(f"⚠️ No pending review with ID `{request_id}`.")
+        return
+    print(f"🚫 Review {request_id} denied by {ctx.author.name}: {reason}")
+    log_review_decision(entry, "deny", f"Review {request_id} denied by {ctx.author.name}: {reason}")
+    await ctx.send(f"🚫 Denied `{request_id}` ({entry['action']} for <@{entry['user_id']}>).")
+
+
 # -----------------------------
 #   BOT EVENTS
 # -----------------------------
@@ -334,8 +552,10 @@ def log_role_history(user_id: int, user_name: str, old_roles: list, new_role: st
 async def on_ready():
     print(f"✅ Bot is online and logged in as {bot.user}")
     load_user_stats()
+    load_pending_reviews()
     save_stats_loop.start()       # Start the periodic user_stats saving
     process_role_requests.start() # Start the periodic role request processing
+    expire_reviews_loop.start()   # Start the periodic expiry of stale reviews
 
 
 # -----------------------------